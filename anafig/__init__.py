@@ -0,0 +1 @@
+"""Shared helpers for the AnaFig generation and evaluation scripts"""
@@ -0,0 +1,3 @@
+from anafig.cli import main
+
+main()
@@ -0,0 +1,123 @@
+"""
+Unified ``anafig`` command
+
+    anafig gen-api      --model_name ... --api_key ... --api_link ...
+    anafig gen-local
+    anafig score-api    --file_name ... --model_name ... --api_key ... --api_link ...
+    anafig score-local  --file_name ... [--model_path ...] [--batch_size ...] [--device cpu]
+    anafig metrics {bleu,meteor,rouge,bertscore} --file_name ...
+    anafig bench-startup
+
+Each subcommand runs the matching script from model/ or eval_method/ with the
+remaining arguments. Only the standard library is imported here, so heavy
+backends (torch, transformers, openai, PIL) load only inside the script
+that needs them.
+"""
+import argparse
+import json
+import os
+import platform
+import runpy
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+COMMANDS = {
+    "gen-api": "model/API_gen.py",
+    "gen-local": "model/Qwen2-VL-7B_gen.py",
+    "score-api": "eval_method/API_score.py",
+    "score-local": "eval_method/local_score.py",
+}
+METRICS = {
+    "bleu": "eval_method/summary_bleu_score.py",
+    "meteor": "eval_method/summary_meteor_score.py",
+    "rouge": "eval_method/summary_rouge_score.py",
+    "bertscore": "eval_method/summary_bert_score.py",
+}
+
+
+def run_script(script, script_args):
+    """Run a repository script as __main__ with the given arguments"""
+    path = os.path.join(REPO_ROOT, script)
+    if not os.path.exists(path):
+        sys.exit(f"anafig: {script} not found; install the repository with 'pip install -e .'")
+    sys.argv = [path] + list(script_args)
+    runpy.run_path(path, run_name="__main__")
+
+
+def bench_startup(repeat, output_path):
+    """
+    Measure cold-start time of every subcommand
+
+    Each subcommand is started ``repeat`` times in a fresh interpreter with
+    ``--help``; the median wall time is printed and appended to
+    ``output_path`` as one JSON line so startup regressions can be tracked.
+    """
+    targets = [[name] for name in COMMANDS] + [["metrics", name] for name in METRICS]
+    timings, failed = {}, []
+    for target in targets:
+        cmd = [sys.executable, "-m", "anafig"] + target + ["--help"]
+        runs = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = subprocess.run(cmd, cwd=REPO_ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            runs.append(time.perf_counter() - start)
+        name = " ".join(target)
+        timings[name] = statistics.median(runs)
+        note = ""
+        if result.returncode != 0:
+            # Usually a missing backend; the time then stops at the failed import
+            failed.append(name)
+            note = "  (failed)"
+        print(f"{name:<20} {timings[name] * 1000:8.1f} ms{note}")
+
+    record = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "repeat": repeat,
+        "median_seconds": timings,
+        "failed": failed,
+    }
+    directory = os.path.dirname(output_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(output_path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, separators=(",", ":")) + "\n")
+    print(f"Appended to {output_path}")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="anafig", description='AnaFig generation and evaluation')
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    # Script subcommands forward --help and every other option to the script
+    for name, script in COMMANDS.items():
+        subparsers.add_parser(name, add_help=False, help=f"Run {script}")
+    metrics = subparsers.add_parser("metrics", add_help=False, help="Run an automatic evaluation metric")
+    metrics.add_argument("metric", choices=sorted(METRICS))
+
+    bench = subparsers.add_parser("bench-startup", help="Measure cold-start time of each subcommand")
+    bench.add_argument('--repeat', type=int, default=5, help='Runs per subcommand')
+    bench.add_argument('--output', default="output/bench/cli_startup.jsonl", help='JSONL file to append results to')
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args, rest = parser.parse_known_args(argv)
+
+    if args.command == "bench-startup":
+        if rest:
+            parser.error(f"unrecognized arguments: {' '.join(rest)}")
+        bench_startup(args.repeat, args.output)
+    elif args.command == "metrics":
+        run_script(METRICS[args.metric], rest)
+    else:
+        run_script(COMMANDS[args.command], rest)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+"""
+Streaming JSON / JSONL reader and writer for dataset and result files
+
+Dataset files map an entry key to an entry dict. Two layouts are supported,
+    .json   the original ``{"0": {...}, "1": {...}}`` object
+    .jsonl  one entry per line, the key stored under ``KEY_FIELD``
+plus an optional ``.gz`` or ``.zst`` suffix for compression.
+
+Reading a .json object uses ``ijson`` when it is installed, so entries are
+yielded one by one instead of loading the whole file. Without ``ijson`` the
+reader falls back to ``json.load`` and still accepts every existing file.
+"""
+import gzip
+import io
+import json
+import os
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+FORMATS = ("json", "jsonl")
+COMPRESSIONS = ("none", "gzip", "zstd")
+COMPRESSION_SUFFIXES = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+KEY_FIELD = "_key"
+SCORE_FIELD = "individual_score"
+
+_DUMP_KWARGS = {"ensure_ascii": False, "separators": (",", ":")}
+
+
+def split_ext(path):
+    """
+    Split a data file path into its stem, format and compression
+
+    Returns:
+        tuple: (stem, format, compression), e.g. ("a/b", "jsonl", "gzip")
+    """
+    compression = "none"
+    for name, suffix in COMPRESSION_SUFFIXES.items():
+        if suffix and path.endswith(suffix):
+            compression = name
+            path = path[:-len(suffix)]
+            break
+
+    stem, ext = os.path.splitext(path)
+    fmt = "jsonl" if ext == ".jsonl" else "json"
+    if ext not in (".json", ".jsonl"):
+        stem = path
+    return stem, fmt, compression
+
+
+def build_path(stem, fmt="json", compression="none"):
+    """Build a file path from a stem, output format and compression"""
+    return f"{stem}.{fmt}{COMPRESSION_SUFFIXES[compression]}"
+
+
+def _zstd():
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError("zstd compression requires the 'zstandard' package") from None
+    return zstandard
+
+
+def open_file(path, mode="rt", compression=None):
+    """
+    Open a possibly compressed file
+
+    Args:
+        path: File path
+        mode: One of 'rt', 'wt', 'rb', 'wb'
+        compression: 'none', 'gzip' or 'zstd'; inferred from the suffix if None
+
+    Returns:
+        File object; text modes use UTF-8
+    """
+    if compression is None:
+        compression = split_ext(path)[2]
+    binary = "b" in mode
+    writing = "w" in mode
+
+    if compression == "gzip":
+        if binary:
+            return gzip.open(path, mode)
+        return gzip.open(path, mode, encoding="utf-8")
+    if compression == "zstd":
+        zstandard = _zstd()
+        raw = open(path, "wb" if writing else "rb")
+        if writing:
+            stream = zstandard.ZstdCompressor().stream_writer(raw)
+        else:
+            stream = zstandard.ZstdDecompressor().stream_reader(raw)
+        if binary:
+            return stream
+        return io.TextIOWrapper(stream, encoding="utf-8")
+    if binary:
+        return open(path, mode)
+    return open(path, mode, encoding="utf-8")
+
+
+def iter_entries(path):
+    """
+    Iterate over the entries of a dataset file
+
+    Args:
+        path: .json / .jsonl file, optionally .gz or .zst compressed
+
+    Yields:
+        tuple: (key, entry)
+    """
+    _, fmt, compression = split_ext(path)
+
+    if fmt == "jsonl":
+        with open_file(path, "rt", compression) as f:
+            for index, line in enumerate(f):
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                key = entry.pop(KEY_FIELD, str(index))
+                yield key, entry
+        return
+
+    if ijson is not None:
+        with open_file(path, "rb", compression) as f:
+            yield from ijson.kvitems(f, "", use_float=True)
+        return
+
+    with open_file(path, "rt", compression) as f:
+        data = json.load(f)
+    yield from data.items()
+
+
+def load_entries(path):
+    """Load a whole dataset file into a dict"""
+    return dict(iter_entries(path))
+
+
+class EntryWriter:
+    """
+    Incrementally write (key, entry) pairs to a dataset file
+
+    The format and compression follow the suffix of ``path``. Data goes to a
+    temporary file that replaces ``path`` only when the writer is closed
+    without an error, so an interrupted run never leaves a truncated file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        _, self.fmt, self.compression = split_ext(path)
+        self._tmp_path = f"{path}.tmp"
+        self._file = None
+        self.count = 0
+
+    def __enter__(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open_file(self._tmp_path, "wt", self.compression)
+        if self.fmt == "json":
+            self._file.write("{")
+        return self
+
+    def write(self, key, entry):
+        """Append one entry"""
+        if self.fmt == "jsonl":
+            record = {KEY_FIELD: key, **entry}
+            self._file.write(json.dumps(record, **_DUMP_KWARGS) + "\n")
+        else:
+            if self.count:
+                self._file.write(",\n")
+            self._file.write(f"{json.dumps(key, **_DUMP_KWARGS)}:{json.dumps(entry, **_DUMP_KWARGS)}")
+        self.count += 1
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.fmt == "json":
+            self._file.write("}\n")
+        self._file.close()
+        if exc_type is None:
+            os.replace(self._tmp_path, self.path)
+        else:
+            os.remove(self._tmp_path)
+        return False
+
+
+def write_entries(path, entries):
+    """
+    Write an iterable of (key, entry) pairs to a dataset file
+
+    Returns:
+        Number of entries written
+    """
+    with EntryWriter(path) as writer:
+        for key, entry in entries:
+            writer.write(key, entry)
+    return writer.count
+
+
+def write_results(path, results):
+    """
+    Write a metric result dict
+
+    In .json files the dict is dumped compactly. In .jsonl files every item of
+    ``individual_scores`` goes on its own line as ``{"individual_score": ...}``
+    and the remaining keys (the averages) follow on the last line.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    _, fmt, compression = split_ext(path)
+
+    with open_file(path, "wt", compression) as f:
+        if fmt == "json":
+            json.dump(results, f, **_DUMP_KWARGS)
+            return
+        summary = {k: v for k, v in results.items() if k != "individual_scores"}
+        for score in results.get("individual_scores", []):
+            f.write(json.dumps({SCORE_FIELD: score}, **_DUMP_KWARGS) + "\n")
+        f.write(json.dumps(summary, **_DUMP_KWARGS) + "\n")
+
+
+def read_results(path):
+    """Read a metric result file written by ``write_results`` or the old scripts"""
+    _, fmt, compression = split_ext(path)
+
+    with open_file(path, "rt", compression) as f:
+        if fmt == "json":
+            return json.load(f)
+        results = {"individual_scores": []}
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if SCORE_FIELD in record:
+                results["individual_scores"].append(record[SCORE_FIELD])
+            else:
+                results.update(record)
+    return results
+
+
+def save_results(input_path, metric, results, output_format="json", compression="none"):
+    """
+    Save metric results to output/score/<input name>-<metric>_score.<ext>
+
+    Returns:
+        Path of the written file
+    """
+    base_name = os.path.basename(input_path).split('.')[0]
+    output_dir = "output/score"
+    output_path = build_path(os.path.join(output_dir, f"{base_name}-{metric}_score"), output_format, compression)
+    write_results(output_path, results)
+    return output_path
+
+
+def add_io_arguments(parser):
+    """Add the shared --output_format / --compression options to an argparse parser"""
+    parser.add_argument('--output_format', default='json', choices=FORMATS,
+                        help='Output layout: compact JSON object or JSON lines')
+    parser.add_argument('--compression', default='none', choices=COMPRESSIONS,
+                        help='Compress the output file')
+    return parser
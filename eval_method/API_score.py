@@ -1,14 +1,24 @@
 import argparse
-import json
 import os
 import re
+import sys
 import time
 import base64
 import io
-from PIL import Image
-from openai import OpenAI
-# Increase image pixel limit
-Image.MAX_IMAGE_PIXELS = 2300000000
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from anafig.jsonio import EntryWriter, add_io_arguments, build_path, iter_entries, split_ext  # noqa: E402
+
+# Scoring instructions shared with the local judge (local_score.py)
+SYSTEM_PROMPT = (
+    "Evaluate the summary based on these criteria with reference summary:\n"
+    "1. Faithfulness: Strict adherence to figure and supplementary content (5-point scale)\n"
+    "2. Completeness: Coverage of all key information (5-point scale)\n"
+    "3. Conciseness: Brevity and clarity (5-point scale)\n"
+    "4. Logicality: Logical coherence and expert knowledge (5-point scale)\n"
+    "5. Analysis: Depth of understanding and interpretation (5-point scale)\n\n"
+    "Output format: 'Faithfulness (X/5); Completeness (X/5); Conciseness (X/5); Logicality (X/5); Analysis (X/5)'"
+)
 
 def encode_image_to_base64(image):
     """Encode PIL image to base64 string"""
@@ -29,18 +39,14 @@ def generate_score(inputs,api_key, base_url, model_name):
     Returns:
         Generated score text or "error" on failure
     """
-    system_prompt = (
-        "Evaluate the summary based on these criteria with reference summary:\n"
-        "1. Faithfulness: Strict adherence to figure and supplementary content (5-point scale)\n"
-        "2. Completeness: Coverage of all key information (5-point scale)\n"
-        "3. Conciseness: Brevity and clarity (5-point scale)\n"
-        "4. Logicality: Logical coherence and expert knowledge (5-point scale)\n"
-        "5. Analysis: Depth of understanding and interpretation (5-point scale)\n\n"
-        "Output format: 'Faithfulness (X/5); Completeness (X/5); Conciseness (X/5); Logicality (X/5); Analysis (X/5)'"
-    )
+    # PIL and openai are imported here so the CLI starts without them
+    from PIL import Image
+    from openai import OpenAI
+    # Increase image pixel limit
+    Image.MAX_IMAGE_PIXELS = 2300000000
 
     messages = [
-        {"role": "system", "content": system_prompt},
+        {"role": "system", "content": SYSTEM_PROMPT},
         {"role": "user", "content": []}
     ]
 
@@ -136,46 +142,40 @@ def main():
     parser.add_argument('--model_name', required=True, help='API model name to use')
     parser.add_argument('--api_key', required=True, help='API secret key')
     parser.add_argument('--api_link', required=True, help='API base URL')
+    add_io_arguments(parser)
     args = parser.parse_args()
 
     # Prepare paths
     input_path = f"{args.file_name}"
     output_dir = "output/score"
     os.makedirs(output_dir, exist_ok=True)
-    output_name = f"{args.file_name.replace('.json','')}_{args.model_name}_score.json"
+    output_name = f"{split_ext(args.file_name)[0]}_{args.model_name}_score"
     #output_path = os.path.join(output_dir, output_name)
-    output_path = output_name.replace(r"/summary_pre/","/score/")
-    # Process dataset
-    with open(input_path, "r", encoding="utf-8") as f:
-        dataset = json.load(f)
-
+    output_path = build_path(output_name, args.output_format, args.compression).replace(r"/summary_pre/","/score/")
+    # Process dataset, streaming entries straight to the output file
     errors = []
-    for key, entry in dataset.items():
-        # Skip already processed entries
-        if 'score' in entry and entry.get('score') != "error!":
-            continue
-        # Skip entries without required summary
-        if 'summary_pre' not in entry:
-            continue
-
-        try:
-            inputs, rich_text = preprocess_input(entry)
-
-            score = generate_score(
-                inputs,
-                api_key=args.api_key,
-                base_url=args.api_link,
-                model_name=args.model_name
-            )
-            entry['score'] = score
-            print(key,score)
-        except Exception as e:
-            print(f"Error processing {key}: {str(e)}")
-            errors.append(key)
-
-    # Save final results
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(dataset, f, ensure_ascii=False, indent=4)
+    with EntryWriter(output_path) as writer:
+        for key, entry in iter_entries(input_path):
+            # Keep already processed entries and entries without required summary as-is
+            if ('score' in entry and entry.get('score') != "error!") or 'summary_pre' not in entry:
+                writer.write(key, entry)
+                continue
+
+            try:
+                inputs, rich_text = preprocess_input(entry)
+
+                score = generate_score(
+                    inputs,
+                    api_key=args.api_key,
+                    base_url=args.api_link,
+                    model_name=args.model_name
+                )
+                entry['score'] = score
+                print(key,score)
+            except Exception as e:
+                print(f"Error processing {key}: {str(e)}")
+                errors.append(key)
+            writer.write(key, entry)
 
     print(f"Processing complete. Saved to {output_path}")
     print(f"Errors: {len(errors)}")
@@ -0,0 +1,183 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from anafig.jsonio import EntryWriter, add_io_arguments, build_path, iter_entries, split_ext  # noqa: E402
+from eval_method.API_score import SYSTEM_PROMPT, preprocess_input  # noqa: E402
+
+
+def build_messages(inputs, Image):
+    """
+    Build a chat conversation for one entry
+
+    Args:
+        inputs: List of input items (text/image) from preprocess_input
+        Image: PIL.Image module
+
+    Returns:
+        List of chat messages with images loaded and resized
+    """
+    messages = [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": []}
+    ]
+
+    for item in inputs:
+        if item['type'] == 'text':
+            messages[1]["content"].append({"type": "text", "text": item['content']})
+        elif item['type'] == 'image':
+            img = Image.open(item['content']).convert("RGB").resize((224, 224))
+            messages[1]["content"].append({"type": "image", "image": img})
+    return messages
+
+
+def generate_scores(batch_messages, model, processor, max_new_tokens=64):
+    """
+    Score a batch of summaries with a local multimodal model
+
+    Args:
+        batch_messages: List of chat conversations, one per summary
+        model: Pretrained Qwen2-VL model
+        processor: AutoProcessor for the model
+
+    Returns:
+        List of generated score texts, one per conversation
+    """
+    from qwen_vl_utils import process_vision_info
+
+    texts = [
+        processor.apply_chat_template(messages, tokenize=False, add_generation_prompt=True)
+        for messages in batch_messages
+    ]
+    image_inputs, _ = process_vision_info(batch_messages)
+
+    model_inputs = processor(
+        text=texts,
+        images=image_inputs,
+        padding=True,
+        return_tensors="pt"
+    ).to(model.device)
+
+    output_ids = model.generate(**model_inputs, max_new_tokens=max_new_tokens, do_sample=False)
+    generated_ids = output_ids[:, model_inputs.input_ids.shape[1]:]
+    return processor.batch_decode(
+        generated_ids,
+        skip_special_tokens=True,
+        clean_up_tokenization_spaces=True
+    )
+
+
+def needs_score(entry):
+    """Whether an entry has a summary to judge and no valid score yet"""
+    if 'summary_pre' not in entry:
+        return False
+    return 'score' not in entry or entry['score'] in ("error", "error!")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Summary Scoring with a local multimodal model')
+    parser.add_argument('--file_name', required=True, help='Name of the input data file')
+    parser.add_argument('--model_path', default='Qwen/Qwen2-VL-7B-Instruct', help='Local path or hub id of the judge model')
+    parser.add_argument('--model_name', default=None, help='Name used in the output file (default: last part of model_path)')
+    parser.add_argument('--batch_size', type=int, default=8, help='Summaries scored per generate call')
+    parser.add_argument('--max_new_tokens', type=int, default=64, help='Generation length for the score text')
+    parser.add_argument('--device', default='cuda', choices=['cuda', 'cpu'], help='Run the judge on GPU or CPU')
+    parser.add_argument('--num_threads', type=int, default=os.cpu_count(), help='CPU threads for torch in CPU mode')
+    add_io_arguments(parser)
+    args = parser.parse_args()
+
+    # Prepare paths
+    input_path = f"{args.file_name}"
+    output_dir = "output/score"
+    os.makedirs(output_dir, exist_ok=True)
+    model_name = args.model_name or os.path.basename(args.model_path.rstrip("/"))
+    output_name = f"{split_ext(args.file_name)[0]}_{model_name}_score"
+    output_path = build_path(output_name, args.output_format, args.compression).replace(r"/summary_pre/","/score/")
+
+    # Load model and processor; torch/transformers are imported only here
+    import torch
+    from PIL import Image
+    from transformers import Qwen2VLForConditionalGeneration, AutoProcessor
+    # Increase image pixel limit
+    Image.MAX_IMAGE_PIXELS = 2300000000
+
+    if args.device == 'cpu':
+        torch.set_num_threads(args.num_threads)
+        model = Qwen2VLForConditionalGeneration.from_pretrained(args.model_path, torch_dtype=torch.float32)
+    else:
+        model = Qwen2VLForConditionalGeneration.from_pretrained(
+            args.model_path,
+            torch_dtype="float16",
+            device_map="auto",
+        )
+    model.eval()
+    processor = AutoProcessor.from_pretrained(args.model_path)
+    # Decoder-only batched generation needs left padding
+    processor.tokenizer.padding_side = "left"
+
+    errors = []
+    scored = 0
+    start = time.perf_counter()
+
+    def flush(writer, buffer, pending):
+        """Score pending entries, then write the buffered entries in input order"""
+        nonlocal scored
+        if pending:
+            batch_start = time.perf_counter()
+            try:
+                with torch.inference_mode():
+                    scores = generate_scores(
+                        [messages for _, _, messages in pending],
+                        model,
+                        processor,
+                        max_new_tokens=args.max_new_tokens
+                    )
+            except Exception as e:
+                print(f"Batch error: {str(e)}")
+                scores = ["error"] * len(pending)
+            for (key, entry, _), score in zip(pending, scores):
+                entry['score'] = score
+                if score == "error":
+                    errors.append(key)
+                print(key, score)
+            scored += len(pending)
+            batch_time = time.perf_counter() - batch_start
+            total_time = time.perf_counter() - start
+            print(f"Batch of {len(pending)}: {len(pending) / batch_time:.2f} summaries/s "
+                  f"(overall {scored / total_time:.2f} summaries/s, {scored} scored)")
+        for key, entry in buffer:
+            writer.write(key, entry)
+        buffer.clear()
+        pending.clear()
+
+    # Process dataset, streaming entries straight to the output file
+    with EntryWriter(output_path) as writer:
+        buffer, pending = [], []
+        for key, entry in iter_entries(input_path):
+            buffer.append((key, entry))
+            if not needs_score(entry):
+                continue
+            try:
+                inputs, rich_text = preprocess_input(entry)
+                pending.append((key, entry, build_messages(inputs, Image)))
+            except Exception as e:
+                print(f"Error processing {key}: {str(e)}")
+                errors.append(key)
+            if len(pending) >= args.batch_size:
+                flush(writer, buffer, pending)
+        flush(writer, buffer, pending)
+
+    total_time = time.perf_counter() - start
+    print(f"Processing complete. Saved to {output_path}")
+    if scored:
+        print(f"Throughput: {scored} summaries in {total_time:.1f}s ({scored / total_time:.2f} summaries/s)")
+    print(f"Errors: {len(errors)}")
+    if errors:
+        error_path = os.path.join(output_dir, f"{model_name}_errors.txt")
+        with open(error_path, "w") as f:
+            f.write("\n".join(errors))
+
+if __name__ == '__main__':
+    main()
@@ -1,14 +1,13 @@
 import argparse
-import json
 import os
 import re
+import sys
 import time
 import base64
 import io
-from PIL import Image
-from openai import OpenAI
-# Increase image pixel limit
-Image.MAX_IMAGE_PIXELS = 2300000000
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from anafig.jsonio import EntryWriter, add_io_arguments, build_path, iter_entries  # noqa: E402
 
 def encode_image_to_base64(image):
     """Encode PIL image to base64 string"""
@@ -39,6 +38,12 @@ def generate_api_summary(inputs,api_key, base_url, model_name):
         "Ensure faithfulness, completeness, conciseness, logicality, and analysis depth."
     )
 
+    # PIL and openai are imported here so the CLI starts without them
+    from PIL import Image
+    from openai import OpenAI
+    # Increase image pixel limit
+    Image.MAX_IMAGE_PIXELS = 2300000000
+
     messages = [
         {"role": "system", "content": system_prompt},
         {"role": "user", "content": []}
@@ -124,38 +129,34 @@ def main():
     parser.add_argument('--model_name', required=True, help='API model name to use')
     parser.add_argument('--api_key', required=True, help='API secret key')
     parser.add_argument('--api_link', required=True, help='API base URL')
+    add_io_arguments(parser)
     args = parser.parse_args()
 
     # Prepare paths
     input_path = f"data/Summary-2000.json"
     output_dir = "output/summary_pre"
     os.makedirs(output_dir, exist_ok=True)
-    output_name = f"Summary-2000_{args.model_name}_gen.json"
-    output_path = os.path.join(output_dir, output_name)
-
-    # Process dataset
-    with open(input_path, "r", encoding="utf-8") as f:
-        dataset = json.load(f)
+    output_name = f"Summary-2000_{args.model_name}_gen"
+    output_path = build_path(os.path.join(output_dir, output_name), args.output_format, args.compression)
 
+    # Process dataset, streaming entries straight to the output file
     errors = []
-    for key, entry in dataset.items():
-        try:
-            inputs, rich_text = preprocess_input(entry)
-            summary = generate_api_summary(
-                inputs,
-                api_key=args.api_key,
-                base_url=args.api_link,
-                model_name=args.model_name
-            )
-            entry['summary_pre'] = summary
-            print(key,summary)
-        except Exception as e:
-            print(f"Error processing {key}: {str(e)}")
-            errors.append(key)
-
-    # Save results
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(dataset, f, ensure_ascii=False, indent=4)
+    with EntryWriter(output_path) as writer:
+        for key, entry in iter_entries(input_path):
+            try:
+                inputs, rich_text = preprocess_input(entry)
+                summary = generate_api_summary(
+                    inputs,
+                    api_key=args.api_key,
+                    base_url=args.api_link,
+                    model_name=args.model_name
+                )
+                entry['summary_pre'] = summary
+                print(key,summary)
+            except Exception as e:
+                print(f"Error processing {key}: {str(e)}")
+                errors.append(key)
+            writer.write(key, entry)
 
     print(f"Processing complete. Saved to {output_path}")
     print(f"Errors: {len(errors)}")
@@ -1,10 +1,11 @@
 import argparse
-import json
 import os
 import re
+import sys
 from PIL import Image
-from transformers import Qwen2VLForConditionalGeneration, AutoProcessor
-from qwen_vl_utils import process_vision_info
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from anafig.jsonio import EntryWriter, add_io_arguments, build_path, iter_entries  # noqa: E402
 
 # Increase image pixel limit
 Image.MAX_IMAGE_PIXELS = 2300000000
@@ -43,6 +44,8 @@ def generate_summary(inputs, model, processor):
             img = Image.open(item['content']).resize((224, 224))
             messages[1]["content"].append({"type": "image", "image": img})
 
+    from qwen_vl_utils import process_vision_info
+
     text = processor.apply_chat_template(messages, tokenize=False, add_generation_prompt=True)
     image_inputs, _ = process_vision_info(messages)
     
@@ -116,16 +119,21 @@ def preprocess_input(data, img_dir="images/AnaFig-image/main-images"):
     return inputs, rich_text
 
 def main():
+    parser = argparse.ArgumentParser(description='Multimodal Summary Generation with Qwen2-VL-7B')
+    add_io_arguments(parser)
+    args = parser.parse_args()
 
     # Prepare paths
     input_path = f"data/Summary-2000.json"
     output_dir = "output/summary_pre"
     os.makedirs(output_dir, exist_ok=True)
-    output_name = f"Summary-2000_Qwen2-VL-7B_gen.json"
-    output_path = os.path.join(output_dir, output_name)
+    output_name = f"Summary-2000_Qwen2-VL-7B_gen"
+    output_path = build_path(os.path.join(output_dir, output_name), args.output_format, args.compression)
 
 
-    # Load model and processor
+    # Load model and processor; transformers pulls in torch, so import it only here
+    from transformers import Qwen2VLForConditionalGeneration, AutoProcessor
+
     model = Qwen2VLForConditionalGeneration.from_pretrained(
         "Qwen/Qwen2-VL-7B-Instruct", 
         torch_dtype="float16", 
@@ -133,24 +141,19 @@ def main():
     )
     processor = AutoProcessor.from_pretrained("Qwen/Qwen2-VL-7B-Instruct")
 
-    # Process dataset
-    with open(input_path, "r", encoding="utf-8") as f:
-        dataset = json.load(f)
-
+    # Process dataset, streaming entries straight to the output file
     errors = []
-    for key, entry in dataset.items():
-        try:
-            inputs, rich_text = preprocess_input(entry)
-            summary = generate_summary(inputs, model, processor)
-            entry['summary_pre'] = summary
-            print(key,summary)
-        except Exception as e:
-            print(f"Error processing {key}: {str(e)}")
-            errors.append(key)
-
-    # Save results
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(dataset, f, ensure_ascii=False, indent=4)
+    with EntryWriter(output_path) as writer:
+        for key, entry in iter_entries(input_path):
+            try:
+                inputs, rich_text = preprocess_input(entry)
+                summary = generate_summary(inputs, model, processor)
+                entry['summary_pre'] = summary
+                print(key,summary)
+            except Exception as e:
+                print(f"Error processing {key}: {str(e)}")
+                errors.append(key)
+            writer.write(key, entry)
 
     print(f"Processing complete. Saved to {output_path}")
     print(f"Errors: {len(errors)}")